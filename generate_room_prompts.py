@@ -6,149 +6,189 @@ These can be used with Stable Diffusion, DALL-E, Midjourney, etc.
 
 import json
 import os
+from functools import lru_cache
+from pathlib import Path
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 def load_temple_data(filepath):
     """Load the temple JSON data"""
+    if orjson is not None:
+        return orjson.loads(Path(filepath).read_bytes())
     with open(filepath, 'r') as f:
         return json.load(f)
 
-def create_room_prompts(temple_data):
-    """Generate optimized image generation prompts for each room"""
+# Base style prompt for consistency
+BASE_STYLE = ("legends of the hidden temple TV show set, nickelodeon 1990s, "
+              "ancient mayan aztec temple room, stone walls with hieroglyphs, "
+              "dramatic torch lighting, mysterious atmosphere, "
+              "game show set design, practical effects, ")
+
+# Skeletons also go into every crypt, whatever its name
+SKELETON_ELEMENT = "ancient skeletons, bones, skulls on shelves"
+
+# Room-name keywords and the scene elements they add, in prompt order
+KEYWORD_ELEMENTS = (
+    ("skeleton", SKELETON_ELEMENT),
+    ("throne", "golden throne, royal chamber, ornate decorations"),
+    ("spider", "giant spider webs, egg sacs, creepy crawlies"),
+    ("swamp", "murky water, fog, hanging vines, moss"),
+    ("forest", "artificial trees, dark foliage, hidden passages"),
+    ("silver monkey", "pedestal with three piece silver monkey statue puzzle"),
+    ("pit", "deep pit, rope bridges, vertical chamber"),
+    ("mirror", "wall of mirrors, reflections, optical illusions"),
+    ("crystal", "glowing crystals, purple and blue lights, mystical cave"),
+    ("lightning", "tesla coils, electrical effects, metal rods, sparks"),
+    ("observatory", "celestial wheel, planets, stars on ceiling, astronomical devices"),
+    ("heart", "sacred altar, jade serpent crown on pedestal, golden light, inner sanctum"),
+    ("viper", "ceramic pots, rubber snakes, snake decorations"),
+    ("snake", "ceramic pots, rubber snakes, snake decorations"),
+    ("waterfall", "rushing waterfall, wet rocks, hidden passage behind water"),
+    ("quicksand", "sand pit, sinking hazard, overhead rope"),
+    ("treasure", "gold coins, treasure chests, jewels, ancient artifacts"),
+    ("gargoyle", "three stone gargoyles, grotesque faces, moveable tongues"),
+    ("jester", "court jester paintings, colorful medieval decorations, bells"),
+    ("music", "ancient drums, gongs, bone xylophone, musical instruments"),
+    ("tomb", "sarcophagus, egyptian style decorations, burial chamber"),
+    ("mine", "mining elevator, wooden supports, vertical shaft, chains"),
+    ("elements", "four element symbols, fire water earth air, mystical circles"),
+)
+
+# Keywords that only count when a second word is also in the room name
+COMPOUND_KEYWORDS = {
+    "heart": "temple",
+}
+
+# Negative prompt for better quality
+NEGATIVE_PROMPT = ("modern, contemporary, bright lighting, clean, text, "
+                   "people, contestants, cameras, crew, watermark, "
+                   "low quality, blurry, deformed")
+
+def build_keyword_automaton():
+    """Build an Aho-Corasick automaton over KEYWORD_ELEMENTS (None without pyahocorasick)"""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for index, (keyword, _) in enumerate(KEYWORD_ELEMENTS):
+        automaton.add_word(keyword, index)
+    automaton.make_automaton()
+    return automaton
+
+KEYWORD_AUTOMATON = build_keyword_automaton()
+
+SETTINGS_SUGGESTION = {
+    "steps": 30,
+    "cfg_scale": 7.5,
+    "size": "768x512",
+    "sampler": "DPM++ 2M Karras"
+}
+
+def match_room_elements(room_id, room_name):
+    """Return the scene elements whose keywords appear in the room name"""
+    name_lc = room_name.lower()
     
-    # Base style prompt for consistency
-    base_style = ("legends of the hidden temple TV show set, nickelodeon 1990s, "
-                 "ancient mayan aztec temple room, stone walls with hieroglyphs, "
-                 "dramatic torch lighting, mysterious atmosphere, "
-                 "game show set design, practical effects, ")
+    if KEYWORD_AUTOMATON is not None:
+        # Single pass over the name; sort hits back into prompt order
+        hit_indexes = sorted({index for _, index in KEYWORD_AUTOMATON.iter(name_lc)})
+        candidates = [KEYWORD_ELEMENTS[index] for index in hit_indexes]
+    else:
+        candidates = [(keyword, element) for keyword, element in KEYWORD_ELEMENTS
+                      if keyword in name_lc]
     
-    room_prompts = {}
+    matched = [element for keyword, element in candidates
+               if COMPOUND_KEYWORDS.get(keyword, keyword) in name_lc]
     
-    for room_id, room_data in temple_data['rooms'].items():
-        room_name = room_data['name']
-        description = room_data['description']
-        
-        # Build specific prompt based on room characteristics
-        specific_elements = []
-        
-        # Add room-specific elements based on keywords
-        if 'skeleton' in room_name.lower() or 'crypt' in room_id:
-            specific_elements.append("ancient skeletons, bones, skulls on shelves")
-        
-        if 'throne' in room_name.lower():
-            specific_elements.append("golden throne, royal chamber, ornate decorations")
-        
-        if 'spider' in room_name.lower():
-            specific_elements.append("giant spider webs, egg sacs, creepy crawlies")
-        
-        if 'swamp' in room_name.lower():
-            specific_elements.append("murky water, fog, hanging vines, moss")
-        
-        if 'forest' in room_name.lower():
-            specific_elements.append("artificial trees, dark foliage, hidden passages")
-        
-        if 'silver monkey' in room_name.lower():
-            specific_elements.append("pedestal with three piece silver monkey statue puzzle")
-        
-        if 'pit' in room_name.lower():
-            specific_elements.append("deep pit, rope bridges, vertical chamber")
-        
-        if 'mirror' in room_name.lower():
-            specific_elements.append("wall of mirrors, reflections, optical illusions")
-        
-        if 'crystal' in room_name.lower():
-            specific_elements.append("glowing crystals, purple and blue lights, mystical cave")
-        
-        if 'lightning' in room_name.lower():
-            specific_elements.append("tesla coils, electrical effects, metal rods, sparks")
-        
-        if 'observatory' in room_name.lower():
-            specific_elements.append("celestial wheel, planets, stars on ceiling, astronomical devices")
-        
-        if 'heart' in room_name.lower() and 'temple' in room_name.lower():
-            specific_elements.append("sacred altar, jade serpent crown on pedestal, golden light, inner sanctum")
-        
-        if 'viper' in room_name.lower() or 'snake' in room_name.lower():
-            specific_elements.append("ceramic pots, rubber snakes, snake decorations")
-        
-        if 'waterfall' in room_name.lower():
-            specific_elements.append("rushing waterfall, wet rocks, hidden passage behind water")
-        
-        if 'quicksand' in room_name.lower():
-            specific_elements.append("sand pit, sinking hazard, overhead rope")
-        
-        if 'treasure' in room_name.lower():
-            specific_elements.append("gold coins, treasure chests, jewels, ancient artifacts")
-        
-        if 'gargoyle' in room_name.lower():
-            specific_elements.append("three stone gargoyles, grotesque faces, moveable tongues")
-        
-        if 'jester' in room_name.lower():
-            specific_elements.append("court jester paintings, colorful medieval decorations, bells")
-        
-        if 'music' in room_name.lower():
-            specific_elements.append("ancient drums, gongs, bone xylophone, musical instruments")
-        
-        if 'tomb' in room_name.lower():
-            specific_elements.append("sarcophagus, egyptian style decorations, burial chamber")
-        
-        if 'mine' in room_name.lower():
-            specific_elements.append("mining elevator, wooden supports, vertical shaft, chains")
-        
-        if 'elements' in room_name.lower():
-            specific_elements.append("four element symbols, fire water earth air, mystical circles")
-        
-        # Build the complete prompt
-        elements_str = ", ".join(specific_elements) if specific_elements else description
-        
-        full_prompt = f"{base_style}{elements_str}, {room_name} room"
-        
-        # Add negative prompt for better quality
-        negative_prompt = ("modern, contemporary, bright lighting, clean, text, "
-                          "people, contestants, cameras, crew, watermark, "
-                          "low quality, blurry, deformed")
-        
-        # Get the image filename from the room data if it exists
-        image_filename = room_data.get('image_file', f'temple_room_{room_id}.png')
-        
-        room_prompts[room_id] = {
-            "room_name": room_name,
-            "image_filename": image_filename,
-            "positive_prompt": full_prompt,
-            "negative_prompt": negative_prompt,
-            "short_prompt": f"Legends of Hidden Temple room: {room_name}, {', '.join(specific_elements[:3]) if specific_elements else description[:50]}",
-            "settings_suggestion": {
-                "steps": 30,
-                "cfg_scale": 7.5,
-                "size": "768x512",
-                "sampler": "DPM++ 2M Karras"
-            }
-        }
-    
-    return room_prompts
+    # Crypts get skeletons even when the name doesn't mention them
+    if 'crypt' in room_id:
+        matched.insert(0, SKELETON_ELEMENT)
+    
+    # viper/snake share an element, so drop repeats while keeping order
+    return list(dict.fromkeys(matched))
+
+@lru_cache(maxsize=256)
+def room_prompt_fields(room_id, room_name, description, image_file):
+    """Build a room's prompt fields as (key, value) pairs, memoized on the room's inputs"""
+    
+    # Build specific prompt based on room characteristics
+    specific_elements = match_room_elements(room_id, room_name)
+    
+    # Build the complete prompt
+    if specific_elements:
+        elements_str = ", ".join(specific_elements)
+        short_str = ", ".join(specific_elements[:3])
+    else:
+        elements_str = description
+        short_str = description[:50]
+    
+    full_prompt = BASE_STYLE + elements_str + ", " + room_name + " room"
+    
+    # Use the image filename from the room data if it exists
+    image_filename = image_file or f'temple_room_{room_id}.png'
+    
+    return (
+        ("room_name", room_name),
+        ("image_filename", image_filename),
+        ("positive_prompt", full_prompt),
+        ("negative_prompt", NEGATIVE_PROMPT),
+        ("short_prompt", "Legends of Hidden Temple room: " + room_name + ", " + short_str),
+        ("settings_suggestion", tuple(SETTINGS_SUGGESTION.items())),
+    )
+
+def build_room_prompt(room_id, room_data):
+    """Build the prompt entry for a single room"""
+    entry = dict(room_prompt_fields(room_id, room_data['name'], room_data['description'],
+                                    room_data.get('image_file')))
+    # Each entry gets its own settings dict so edits can't leak between rooms
+    entry['settings_suggestion'] = dict(entry['settings_suggestion'])
+    return entry
+
+def create_room_prompts(temple_data):
+    """Generate optimized image generation prompts for each room"""
+    return {room_id: build_room_prompt(room_id, room_data)
+            for room_id, room_data in temple_data['rooms'].items()}
 
 def save_prompts(room_prompts, output_file):
     """Save prompts to a JSON file"""
-    with open(output_file, 'w') as f:
-        json.dump(room_prompts, f, indent=2)
+    # Serialize up front so the file is written in one go either way
+    if orjson is not None:
+        data = orjson.dumps(room_prompts, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    else:
+        data = (json.dumps(room_prompts, indent=2) + "\n").encode()
+    Path(output_file).write_bytes(data)
     print(f"Saved {len(room_prompts)} room prompts to {output_file}")
 
 def update_temple_with_image_files(temple_file, room_prompts):
     """Update the main temple JSON with image filenames"""
     # Load the temple data
-    with open(temple_file, 'r') as f:
-        temple_data = json.load(f)
+    temple_data = load_temple_data(temple_file)
     
     # Update each room with its image filename
     updated_count = 0
+    changed = False
     for room_id, room_data in temple_data['rooms'].items():
         if room_id in room_prompts:
             # Add or update the image_file property
-            room_data['image_file'] = room_prompts[room_id]['image_filename']
+            image_filename = room_prompts[room_id]['image_filename']
+            if room_data.get('image_file') != image_filename:
+                room_data['image_file'] = image_filename
+                changed = True
             updated_count += 1
     
-    # Save the updated temple data
-    with open(temple_file, 'w') as f:
-        json.dump(temple_data, f, indent=2)
+    # Save the updated temple data, skipping the rewrite if nothing changed
+    if changed:
+        if orjson is not None:
+            Path(temple_file).write_bytes(orjson.dumps(temple_data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(temple_file, 'w') as f:
+                json.dump(temple_data, f, indent=2)
     
     print(f"Updated {updated_count} rooms in {temple_file} with image filenames")
 
@@ -6,15 +6,58 @@ Uses Stable Diffusion WebUI API (Automatic1111) at http://localhost:7860
 
 import json
 import os
+import atexit
+import binascii
+import hashlib
+import shutil
 from pathlib import Path
 import requests
-import base64
+from requests.adapters import HTTPAdapter
 import time
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
 import sys
+import threading
+
+try:
+    from pybase64 import b64decode
+except ImportError:
+    from base64 import b64decode
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import termios
+    import tty
+except ImportError:
+    termios = None
+
+def create_session() -> requests.Session:
+    """Create a keep-alive session so API calls reuse one connection"""
+    session = requests.Session()
+    session.headers["Connection"] = "keep-alive"
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=4)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+# Shared by every API helper below
+SESSION = create_session()
+
+# Renders keyed by payload hash live here, inside the output directory
+CACHE_DIR_NAME = '.cache'
+
+# Requests that fail faster than this make the next request wait a little
+QUICK_FAILURE_SECONDS = 2.0
+MAX_BACKOFF_SECONDS = 1.0
 
 def load_prompts(prompt_file: str) -> Dict:
     """Load room prompts from JSON"""
+    if orjson is not None:
+        return orjson.loads(Path(prompt_file).read_bytes())
     with open(prompt_file, 'r') as f:
         return json.load(f)
 
@@ -24,32 +67,38 @@ def ensure_output_dir() -> Path:
     output_dir.mkdir(exist_ok=True)
     return output_dir
 
-def check_api_status(api_url: str = "http://localhost:7860") -> bool:
-    """Check if the Stable Diffusion API is running"""
+def fetch_options(api_url: str = "http://localhost:7860") -> Optional[Dict]:
+    """Fetch the current API options, or None if the API isn't running"""
     try:
-        response = requests.get(f"{api_url}/sdapi/v1/options", timeout=5)
+        response = SESSION.get(f"{api_url}/sdapi/v1/options", timeout=5)
         if response.status_code == 200:
             print(f"✅ API is running at {api_url}")
-            return True
+            return response.json()
     except:
         pass
     print(f"❌ API not accessible at {api_url}")
     print("   Make sure Automatic1111 WebUI is running with --api flag")
     print("   Launch command: python launch.py --api")
-    return False
+    return None
 
-def get_api_info(api_url: str = "http://localhost:7860") -> Dict:
+def check_api_status(api_url: str = "http://localhost:7860") -> bool:
+    """Check if the Stable Diffusion API is running"""
+    return fetch_options(api_url) is not None
+
+def get_api_info(api_url: str = "http://localhost:7860", options: Optional[Dict] = None) -> Dict:
     """Get information about the API and current settings"""
     info = {}
     try:
-        # Get current options
-        response = requests.get(f"{api_url}/sdapi/v1/options")
-        if response.status_code == 200:
-            options = response.json()
+        # Get current options unless the caller already has them
+        if options is None:
+            response = SESSION.get(f"{api_url}/sdapi/v1/options")
+            if response.status_code == 200:
+                options = response.json()
+        if options is not None:
             info['model'] = options.get("sd_model_checkpoint", "Unknown")
             
         # Get available samplers
-        response = requests.get(f"{api_url}/sdapi/v1/samplers")
+        response = SESSION.get(f"{api_url}/sdapi/v1/samplers")
         if response.status_code == 200:
             samplers = response.json()
             info['samplers'] = [s['name'] for s in samplers]
@@ -59,27 +108,30 @@ def get_api_info(api_url: str = "http://localhost:7860") -> Dict:
     
     return info
 
-def ensure_correct_model(api_url: str = "http://localhost:7860") -> bool:
+# Checkpoint ensure_correct_model switches to
+SD15_CHECKPOINT = 'v1-5-pruned-emaonly-fp16.safetensors [e9476a1372]'
+
+def ensure_correct_model(api_url: str = "http://localhost:7860", options: Optional[Dict] = None) -> bool:
     """Ensure the correct SD 1.5 model is loaded"""
     try:
-        # Get current options
-        opt = requests.get(url=f'{api_url}/sdapi/v1/options')
-        if opt.status_code != 200:
-            print(f"❌ Failed to get options: {opt.status_code}")
-            return False
+        # Get current options unless the caller already has them
+        if options is None:
+            opt = SESSION.get(url=f'{api_url}/sdapi/v1/options')
+            if opt.status_code != 200:
+                print(f"❌ Failed to get options: {opt.status_code}")
+                return False
+            options = opt.json()
             
-        opt_json = opt.json()
-        current_model = opt_json.get('sd_model_checkpoint', '')
+        current_model = options.get('sd_model_checkpoint', '')
         
         # Check if we need to switch models
         if 'hunyuan' in current_model.lower():
             print("⚠️  Hunyuan model detected, switching to SD 1.5...")
-            # Update the model in options
-            opt_json['sd_model_checkpoint'] = 'v1-5-pruned-emaonly-fp16.safetensors [e9476a1372]'
-            
-            # Post the updated options
-            response = requests.post(url=f'{api_url}/sdapi/v1/options', json=opt_json)
+            # Post a copy so the caller's options only change if the switch works
+            new_options = {**options, 'sd_model_checkpoint': SD15_CHECKPOINT}
+            response = SESSION.post(url=f'{api_url}/sdapi/v1/options', json=new_options)
             if response.status_code == 200:
+                options.update(new_options)
                 print("✅ Switched to SD 1.5 model")
                 time.sleep(2)  # Give it a moment to switch models
                 return True
@@ -93,9 +145,10 @@ def ensure_correct_model(api_url: str = "http://localhost:7860") -> bool:
         else:
             print(f"⚠️  Unknown model active: {current_model}")
             print("   Attempting to set SD 1.5 model...")
-            opt_json['sd_model_checkpoint'] = 'v1-5-pruned-emaonly-fp16.safetensors [e9476a1372]'
-            response = requests.post(url=f'{api_url}/sdapi/v1/options', json=opt_json)
+            new_options = {**options, 'sd_model_checkpoint': SD15_CHECKPOINT}
+            response = SESSION.post(url=f'{api_url}/sdapi/v1/options', json=new_options)
             if response.status_code == 200:
+                options.update(new_options)
                 print("✅ Set to SD 1.5 model")
                 time.sleep(2)
                 return True
@@ -105,9 +158,8 @@ def ensure_correct_model(api_url: str = "http://localhost:7860") -> bool:
         print(f"❌ Error checking/setting model: {e}")
         return False
 
-def generate_image(room_data: Dict, output_file: Path, api_url: str = "http://localhost:7860",
-                  custom_settings: Optional[Dict] = None) -> bool:
-    """Generate a single image using the API"""
+def build_payload(room_data: Dict, custom_settings: Optional[Dict] = None) -> Dict:
+    """Build the txt2img payload for a room"""
     
     # Base payload from room data
     payload = {
@@ -133,100 +185,247 @@ def generate_image(room_data: Dict, output_file: Path, api_url: str = "http://lo
     if custom_settings:
         payload.update(custom_settings)
     
+    return payload
+
+def post_txt2img(payload: Dict, api_url: str = "http://localhost:7860") -> Tuple[Optional[Dict], str]:
+    """Send a txt2img request; returns (result, error message)"""
     try:
         # Make the API request
-        response = requests.post(
+        response = SESSION.post(
             f"{api_url}/sdapi/v1/txt2img",
             json=payload,
             timeout=120  # 2 minutes timeout for generation
         )
         
         if response.status_code == 200:
-            result = response.json()
-            
-            # The API returns base64 encoded images
-            if 'images' in result and len(result['images']) > 0:
-                image_data = result['images'][0]
-                
-                # Decode and save the image
-                image_bytes = base64.b64decode(image_data)
-                with open(output_file, 'wb') as f:
-                    f.write(image_bytes)
-                
-                # Extract seed if available
-                seed = "Unknown"
-                if 'info' in result:
-                    try:
-                        info = json.loads(result['info'])
-                        seed = info.get('seed', 'Unknown')
-                    except:
-                        pass
-                
-                print(f"   ✅ Saved! (seed: {seed})")
-                return True
-            else:
-                print(f"   ❌ No image in response")
-                return False
-        else:
-            print(f"   ❌ API error: {response.status_code}")
-            if response.text:
-                print(f"      {response.text[:200]}")
-            return False
+            # orjson parses the raw body directly, skipping requests' text decode
+            if orjson is not None:
+                return orjson.loads(response.content), ""
+            return response.json(), ""
+        
+        error = f"❌ API error: {response.status_code}"
+        if response.content:
+            # Decode just the slice we show instead of the whole body
+            error += f"\n      {response.content[:200].decode('utf-8', 'replace')}"
+        return None, error
             
     except requests.exceptions.Timeout:
-        print(f"   ⏱️ Request timed out (120s)")
-        return False
+        return None, "⏱️ Request timed out (120s)"
     except Exception as e:
-        print(f"   ❌ Error: {str(e)}")
+        return None, f"❌ Error: {str(e)}"
+
+class RequestBackoff:
+    """Pause shared by the txt2img requests of one batch"""
+    
+    def __init__(self):
+        self._until = 0.0
+        self._lock = threading.Lock()
+    
+    def wait(self) -> None:
+        """Sleep until any pending backoff has passed"""
+        with self._lock:
+            delay = self._until - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+    
+    def record(self, succeeded: bool, elapsed: float) -> None:
+        """Start a short backoff after a request that failed quickly"""
+        # Fast errors usually mean the server is struggling (e.g. out of VRAM),
+        # so give it a moment before the next request goes out
+        if succeeded or elapsed >= QUICK_FAILURE_SECONDS:
+            return
+        until = time.monotonic() + min(MAX_BACKOFF_SECONDS, QUICK_FAILURE_SECONDS - elapsed)
+        with self._lock:
+            self._until = max(self._until, until)
+
+def request_image(payload: Dict, api_url: str = "http://localhost:7860",
+                  backoff: Optional[RequestBackoff] = None) -> Tuple[Optional[Dict], str]:
+    """Send a txt2img request, backing off briefly after a quick failure"""
+    if backoff is None:
+        backoff = RequestBackoff()
+    backoff.wait()
+    
+    started = time.monotonic()
+    result, error = post_txt2img(payload, api_url)
+    backoff.record(result is not None, time.monotonic() - started)
+    
+    return result, error
+
+def save_image(result: Optional[Dict], error: str, output_file: Path) -> bool:
+    """Decode and save the image from a txt2img result"""
+    if result is None:
+        print(f"   {error}")
+        return False
+    
+    # The API returns base64 encoded images
+    if 'images' in result and len(result['images']) > 0:
+        image_data = result['images'][0]
+        
+        # Decode and save the image
+        try:
+            output_file.write_bytes(b64decode(image_data))
+        except (binascii.Error, ValueError, OSError) as e:
+            print(f"   ❌ Error: {str(e)}")
+            return False
+        
+        # Extract seed if available
+        seed = "Unknown"
+        if 'info' in result:
+            try:
+                info = json.loads(result['info'])
+                seed = info.get('seed', 'Unknown')
+            except:
+                pass
+        
+        print(f"   ✅ Saved! (seed: {seed})")
+        return True
+    else:
+        print(f"   ❌ No image in response")
         return False
 
+def cached_image_path(output_dir: Path, payload: Dict) -> Path:
+    """Path of the cached render for a txt2img payload"""
+    key = hashlib.blake2b(json.dumps(payload, sort_keys=True).encode(), digest_size=16).hexdigest()
+    return output_dir / CACHE_DIR_NAME / f"{key}.png"
+
+def cache_image(output_file: Path, cached_file: Path) -> None:
+    """Keep a copy of a fresh render in the prompt cache"""
+    # Copy rather than hardlink: write_bytes rewrites room images in place,
+    # which would silently change a linked cache entry
+    try:
+        cached_file.parent.mkdir(exist_ok=True)
+        shutil.copyfile(output_file, cached_file)
+    except OSError as e:
+        print(f"   Warning: Could not cache image: {e}")
+
+def generate_image(room_data: Dict, output_file: Path, api_url: str = "http://localhost:7860",
+                  custom_settings: Optional[Dict] = None) -> bool:
+    """Generate a single image using the API"""
+    payload = build_payload(room_data, custom_settings)
+    result, error = request_image(payload, api_url)
+    if not save_image(result, error, output_file):
+        return False
+    # Random-seed renders can never be restored, so don't keep a copy
+    if payload['seed'] != -1:
+        cache_image(output_file, cached_image_path(output_file.parent, payload))
+    return True
+
 def batch_generate(prompt_data: Dict, output_dir: Path, api_url: str = "http://localhost:7860",
                   skip_existing: bool = True, custom_settings: Optional[Dict] = None) -> None:
     """Generate all temple room images"""
     
-    if not check_api_status(api_url):
+    # One options fetch serves the status check, model check and model report
+    options = fetch_options(api_url)
+    if options is None:
         return
     
-    # Ensure correct model is loaded
-    if not ensure_correct_model(api_url):
+    # Ensure correct model is loaded (updates options if it switches)
+    if not ensure_correct_model(api_url, options):
         print("⚠️  Warning: Could not verify/set model, continuing anyway...")
         print()
     
-    # Get API info
-    api_info = get_api_info(api_url)
-    if api_info.get('model'):
-        print(f"📦 Model: {api_info['model']}")
+    if options.get('sd_model_checkpoint'):
+        print(f"📦 Model: {options['sd_model_checkpoint']}")
     print(f"📂 Output: {output_dir}")
     print()
     
     total_rooms = len(prompt_data)
     generated = 0
+    restored = 0
     skipped = 0
     failed = 0
     
     print("Starting generation...")
     print("=" * 60)
     
-    for idx, (room_id, room_data) in enumerate(prompt_data.items(), 1):
-        output_file = output_dir / room_data['image_filename']
-        
-        # Skip if exists
-        if skip_existing and output_file.exists():
-            print(f"[{idx:2d}/{total_rooms}] ⏭️  {room_data['room_name'][:30]:30} (exists)")
-            skipped += 1
-            continue
-        
-        print(f"[{idx:2d}/{total_rooms}] 🎨 {room_data['room_name'][:30]:30}", end=" ")
+    # Two workers keep the next request queued on the SD server while this
+    # thread decodes and saves the previous image
+    executor = ThreadPoolExecutor(max_workers=2)
+    backoff = RequestBackoff()
+    try:
+        # One directory listing instead of a stat per room
+        existing = {entry.name for entry in os.scandir(output_dir)} if skip_existing else set()
         
-        # Generate the image
-        if generate_image(room_data, output_file, api_url, custom_settings):
-            generated += 1
-        else:
-            failed += 1
+        # Each job's source is None (exists), a cached render, or a pending request;
+        # its cached_file is None when the render shouldn't be cached
+        jobs = []
+        requests_by_payload = {}
+        for idx, (room_id, room_data) in enumerate(prompt_data.items(), 1):
+            output_file = output_dir / room_data['image_filename']
+            
+            # Skip if exists
+            if room_data['image_filename'] in existing:
+                jobs.append((idx, room_data, output_file, None, None))
+                continue
+            
+            payload = build_payload(room_data, custom_settings)
+            cached_file = cached_image_path(output_dir, payload)
+            
+            # Only a fixed seed makes a render repeatable, so random-seed
+            # payloads always go to the API for a fresh image
+            if payload['seed'] != -1 and cached_file.exists():
+                jobs.append((idx, room_data, output_file, cached_file, cached_file))
+                continue
+            
+            # Rooms with an identical payload share one request
+            if cached_file not in requests_by_payload:
+                requests_by_payload[cached_file] = executor.submit(request_image, payload, api_url, backoff)
+            # Random-seed renders can never be restored, so they aren't cached
+            cache_to = cached_file if payload['seed'] != -1 else None
+            jobs.append((idx, room_data, output_file, cache_to, requests_by_payload[cached_file]))
         
-        # Small delay between requests
-        if idx < total_rooms:
-            time.sleep(0.5)
+        # Report and save results in room order
+        saved_by_request = {}
+        for idx, room_data, output_file, cached_file, source in jobs:
+            if source is None:
+                print(f"[{idx:2d}/{total_rooms}] ⏭️  {room_data['room_name'][:30]:30} (exists)")
+                skipped += 1
+                continue
+            
+            print(f"[{idx:2d}/{total_rooms}] 🎨 {room_data['room_name'][:30]:30}", end=" ", flush=True)
+            
+            if source is cached_file:
+                try:
+                    shutil.copyfile(cached_file, output_file)
+                except OSError as e:
+                    print(f"   ❌ Error: {str(e)}")
+                    failed += 1
+                    continue
+                print("   ♻️  Restored from prompt cache")
+                restored += 1
+                continue
+            
+            if source in saved_by_request:
+                first_file, first_name = saved_by_request[source]
+                try:
+                    shutil.copyfile(first_file, output_file)
+                except OSError as e:
+                    print(f"   ❌ Error: {str(e)}")
+                    failed += 1
+                    continue
+                print(f"   ♻️  Same prompt as {first_name}")
+                restored += 1
+                continue
+            
+            result, error = source.result()
+            if save_image(result, error, output_file):
+                if cached_file is not None:
+                    cache_image(output_file, cached_file)
+                saved_by_request[source] = (output_file, room_data['room_name'])
+                generated += 1
+            else:
+                failed += 1
+    except KeyboardInterrupt:
+        # A worker may still be blocked on txt2img and a normal exit would
+        # wait for it, so close the session and leave immediately
+        executor.shutdown(wait=False, cancel_futures=True)
+        print("\n\n👋 Generation interrupted!")
+        sys.stdout.flush()
+        SESSION.close()
+        os._exit(130)
+    finally:
+        # Drop queued requests if we're bailing out early
+        executor.shutdown(wait=False, cancel_futures=True)
     
     # Summary
     print()
@@ -234,12 +433,14 @@ def batch_generate(prompt_data: Dict, output_dir: Path, api_url: str = "http://l
     print("GENERATION COMPLETE")
     print("=" * 60)
     print(f"✅ Generated: {generated} images")
+    if restored > 0:
+        print(f"♻️  Restored: {restored} images (same prompt and settings)")
     print(f"⏭️  Skipped: {skipped} images (already existed)")
     if failed > 0:
         print(f"❌ Failed: {failed} images")
     print(f"📊 Total: {total_rooms} rooms")
     
-    if generated > 0:
+    if generated + restored > 0:
         print(f"\n🎮 You can now run the game to see your images!")
         print(f"   python3 temple_runner.py")
 
@@ -323,11 +524,29 @@ def custom_settings_menu() -> Optional[Dict]:
     
     return settings if settings else None
 
+def read_key(prompt: str) -> str:
+    """Read a one-keypress answer (no Enter needed on a terminal)"""
+    if termios is None or not sys.stdin.isatty():
+        return input(prompt).strip()
+    
+    print(prompt, end="", flush=True)
+    fd = sys.stdin.fileno()
+    old_settings = termios.tcgetattr(fd)
+    try:
+        tty.setcbreak(fd)
+        key = sys.stdin.read(1)
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+    print(key)  # cbreak mode doesn't echo
+    return key.strip()
+
 def main():
     """Main execution"""
     prompt_file = '/home/aaron/Projects/games/maze/temple-room-prompts.json'
     api_url = "http://localhost:7860"
     
+    atexit.register(SESSION.close)
+    
     # Check for custom API URL argument
     if len(sys.argv) > 1:
         api_url = sys.argv[1]
@@ -354,11 +573,11 @@ def main():
     print("5. Check API status")
     print("6. Exit")
     
-    choice = input("\nSelect option (1-6): ").strip()
+    choice = read_key("\nSelect option (1-6): ")
     
     if choice == '1':
         print("\n⚠️  This will overwrite existing images!")
-        confirm = input("Continue? (y/n): ").strip().lower()
+        confirm = read_key("Continue? (y/n): ").lower()
         if confirm == 'y':
             batch_generate(prompt_data, output_dir, api_url, skip_existing=False)
     
@@ -375,8 +594,9 @@ def main():
                       custom_settings=custom_settings)
     
     elif choice == '5':
-        if check_api_status(api_url):
-            api_info = get_api_info(api_url)
+        options = fetch_options(api_url)
+        if options is not None:
+            api_info = get_api_info(api_url, options)
             print(f"\n📦 Current model: {api_info.get('model', 'Unknown')}")
             if 'samplers' in api_info:
                 print(f"🎨 Available samplers:")
@@ -387,9 +607,14 @@ def main():
     
     elif choice == '6':
         print("\n👋 Goodbye! May Olmec guide your way!")
+        sys.exit(0)
     
     else:
         print("\n❌ Invalid option")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    try:
+        main()
+    except KeyboardInterrupt:
+        print("\n\n👋 Generation interrupted!")
+        sys.exit(130)
\ No newline at end of file
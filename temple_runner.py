@@ -9,13 +9,24 @@ import random
 import time
 import sys
 import traceback
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+from typing import Dict, List, Optional, Set, Tuple
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import chain
 from enum import Enum
 import os
+import re
+import mmap
+import pickle
+import shutil
 import subprocess
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 class Color:
     """ANSI color codes for terminal output"""
     RED = '\033[91m'
@@ -27,201 +38,359 @@ class Color:
     BOLD = '\033[1m'
     END = '\033[0m'
 
-@dataclass
+# Banner rules, rendered once instead of on every screen
+_SEP = '=' * 60
+_SEP_CYAN = f"{Color.CYAN}{_SEP}"
+_SEP_YELLOW = f"{Color.YELLOW}{_SEP}"
+_SEP_END = f"{_SEP}{Color.END}"
+_TILDE_PURPLE = f"{Color.PURPLE}{Color.BOLD}{'~' * 60}"
+_TILDE_END = f"{'~' * 60}{Color.END}"
+
+# Random flavor text shown after some moves
+_FLAVOR_TEXTS = (
+    "The ancient mechanisms groan as a door opens...",
+    "Stone grinds against stone...",
+    "You hear whispers from the temple spirits...",
+    "The path ahead beckons...",
+    "Your footsteps echo through the ancient halls...",
+)
+
+def load_json(path: str):
+    """Load a JSON config file, parsing the raw bytes with orjson when available"""
+    if orjson is not None:
+        # Parse straight from the mapped file rather than copying it into a bytes object
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                return orjson.loads(view)
+    with open(path, 'r') as f:
+        return json.load(f)
+
+def load_json_cached(path: str):
+    """Load a JSON config file through a pickle sidecar, re-parsing when the JSON changes"""
+    stat = os.stat(path)
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cache_path = path + '.pkl'
+    
+    try:
+        with open(cache_path, 'rb') as f:
+            cached_stamp, data = pickle.load(f)
+        if cached_stamp == stamp:
+            return data
+    except Exception:
+        # Missing, stale-format or corrupt sidecar - just rebuild it
+        pass
+    
+    data = load_json(path)
+    try:
+        tmp_path = cache_path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            pickle.dump((stamp, data), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # Read-only install, etc. - the JSON load still worked
+        pass
+    return data
+
+@dataclass(slots=True)
 class Player:
     """Represents the player running through the temple"""
     pendants_of_life: int = 2
-    path_taken: List[str] = None
+    path_taken: List[str] = field(default_factory=list)
     time_remaining: float = 180.0
     has_artifact: bool = False
     guards_encountered: int = 0
-    
-    def __post_init__(self):
-        if self.path_taken is None:
-            self.path_taken = []
 
 class PrizeTracker:
     """Track and display prizes won during the game"""
     
-    def __init__(self, prize_file: str):
+    def __init__(self, prize_file: str, fast_mode: bool = False, rng: Optional[random.Random] = None):
         """Load prize configuration"""
+        self.fast_mode = fast_mode
+        self._rng = rng or random.Random()
         try:
-            with open(prize_file, 'r') as f:
-                self.prize_data = json.load(f)['prizes']
+            self.prize_data = load_json_cached(prize_file)['prizes']
         except FileNotFoundError:
             self.prize_data = None
+        else:
+            self._precompute_prize_values(self.prize_data)
+    
+    @classmethod
+    def _precompute_prize_values(cls, node):
+        """Store each prize's dollar value as an int under '_value_int'"""
+        if isinstance(node, dict):
+            if isinstance(node.get('value'), str):
+                node['_value_int'] = int(re.sub(r'\D', '', node['value']) or '0')
+            for child in node.values():
+                cls._precompute_prize_values(child)
+        elif isinstance(node, list):
+            for child in node:
+                cls._precompute_prize_values(child)
             
-    def get_prizes_won(self, player: Player, won: bool, rooms_visited: int, total_rooms: int) -> List[Dict]:
-        """Determine which prizes were won based on performance"""
-        if not self.prize_data:
-            return []
-            
-        prizes = []
-        
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _compute_prize_keys(won: bool, rooms_visited: int, total_rooms: int, has_artifact: bool,
+                            no_guards: bool, speed_bonus: bool) -> Tuple[Tuple[str, ...], ...]:
+        """Key paths into the prize data for each prize list (or single prize) earned"""
         # Everyone gets participation prizes
-        prizes.extend(self.prize_data['participation']['items'])
+        keys = [('participation', 'items')]
         
         # Assume they made it through earlier rounds
-        prizes.extend(self.prize_data['moat_crossing']['items'])
-        prizes.extend(self.prize_data['steps_of_knowledge']['items'])
+        keys.append(('moat_crossing', 'items'))
+        keys.append(('steps_of_knowledge', 'items'))
         
         # Temple Games - got 2 pendants (full pendant prize)
-        prizes.extend(self.prize_data['temple_games']['full_pendant'])
+        keys.append(('temple_games', 'full_pendant'))
         
         # Temple Run prizes
         if rooms_visited >= 1:
-            prizes.extend(self.prize_data['temple_run']['reached_temple'])
+            keys.append(('temple_run', 'reached_temple'))
         
         if rooms_visited >= 5:
-            prizes.extend(self.prize_data['temple_run']['five_rooms'])
+            keys.append(('temple_run', 'five_rooms'))
             
-        if player.has_artifact:
-            prizes.extend(self.prize_data['temple_run']['grabbed_artifact'])
+        if has_artifact:
+            keys.append(('temple_run', 'grabbed_artifact'))
             
         if won:
             # GRAND PRIZE!
-            prizes.extend(self.prize_data['temple_run']['temple_completion']['grand_prizes'])
+            keys.append(('temple_run', 'temple_completion', 'grand_prizes'))
             
         # Bonus prizes
-        if 180 - player.time_remaining < 60:
-            prizes.append(self.prize_data['consolation_prizes']['speed_bonus_under_60_seconds'])
+        if speed_bonus:
+            keys.append(('consolation_prizes', 'speed_bonus_under_60_seconds'))
             
-        if player.guards_encountered == 0 and won:
-            prizes.append(self.prize_data['consolation_prizes']['no_temple_guards_met'])
+        if no_guards and won:
+            keys.append(('consolation_prizes', 'no_temple_guards_met'))
             
         if rooms_visited == total_rooms:
-            prizes.append(self.prize_data['consolation_prizes']['all_rooms_visited'])
+            keys.append(('consolation_prizes', 'all_rooms_visited'))
             
-        return prizes
+        return tuple(keys)
+    
+    def get_prizes_won(self, player: Player, won: bool, rooms_visited: int, total_rooms: int) -> List[Dict]:
+        """Determine which prizes were won based on performance"""
+        if not self.prize_data:
+            return []
+        
+        keys = self._compute_prize_keys(
+            won, rooms_visited, total_rooms, player.has_artifact,
+            player.guards_encountered == 0, 180 - player.time_remaining < 60
+        )
+        
+        sources = []
+        for key in keys:
+            node = self.prize_data
+            for part in key:
+                node = node[part]
+            # Lists hold a group of prizes, bonus entries are a single prize
+            sources.append(node if isinstance(node, list) else (node,))
+        
+        # Flatten in one pass rather than growing the list extend by extend
+        return list(chain.from_iterable(sources))
     
     def announce_prizes(self, prizes: List[Dict], won: bool):
         """Display prizes in classic game show announcer style"""
         if not prizes:
             return
-            
-        print(f"\n{Color.YELLOW}{'='*60}")
-        print(f"{Color.BOLD}🎁 PRIZES AWARDED! 🎁")
-        print(f"{'='*60}{Color.END}\n")
         
-        # Kirk Fogg style announcement
-        print(f"{Color.CYAN}{Color.BOLD}[KIRK]: Tell them what they've won!{Color.END}\n")
-        time.sleep(1)
+        # Each block between dramatic pauses goes out in a single write
+        buf = [
+            f"\n{_SEP_YELLOW}\n",
+            f"{Color.BOLD}🎁 PRIZES AWARDED! 🎁\n",
+            f"{_SEP_END}\n\n",
+            # Kirk Fogg style announcement
+            f"{Color.CYAN}{Color.BOLD}[KIRK]: Tell them what they've won!{Color.END}\n\n",
+        ]
+        sys.stdout.write(''.join(buf))
+        sys.stdout.flush()
+        if not self.fast_mode:
+            time.sleep(1)
         
         # Announcer voice
-        print(f"{Color.GREEN}{Color.BOLD}[ANNOUNCER]: {Color.END}")
+        sys.stdout.write(f"{Color.GREEN}{Color.BOLD}[ANNOUNCER]: {Color.END}\n")
         
         total_value = 0
         for i, prize in enumerate(prizes):
             if isinstance(prize, dict):
-                time.sleep(0.5)
-                print(f"\n{Color.YELLOW}★ {prize['name'].upper()}{Color.END}")
-                print(f"  {prize['description']}")
-                print(f"  {Color.CYAN}Provided by: {prize['sponsor']}{Color.END}")
+                sys.stdout.flush()
+                if not self.fast_mode:
+                    time.sleep(0.5)
+                buf = [
+                    f"\n{Color.YELLOW}★ {prize['name'].upper()}{Color.END}\n",
+                    f"  {prize['description']}\n",
+                    f"  {Color.CYAN}Provided by: {prize['sponsor']}{Color.END}\n",
+                ]
                 
                 # Special handling for Space Camp
                 if 'includes' in prize:
-                    print(f"  {Color.GREEN}Package includes:{Color.END}")
+                    buf.append(f"  {Color.GREEN}Package includes:{Color.END}\n")
                     for item in prize['includes']:
-                        print(f"    • {item}")
+                        buf.append(f"    • {item}\n")
+                sys.stdout.write(''.join(buf))
                 
-                # Parse value
-                value_str = prize.get('value', '$0')
-                value_num = int(''.join(c for c in value_str if c.isdigit()))
-                total_value += value_num
+                total_value += prize.get('_value_int', 0)
         
-        print(f"\n{Color.YELLOW}{'='*60}")
-        print(f"{Color.BOLD}TOTAL PRIZE VALUE: ${total_value:,}{Color.END}")
-        print(f"{'='*60}{Color.END}\n")
+        buf = [
+            f"\n{_SEP_YELLOW}\n",
+            f"{Color.BOLD}TOTAL PRIZE VALUE: ${total_value:,}{Color.END}\n",
+            f"{_SEP_END}\n\n",
+        ]
         
         if won:
-            print(f"{Color.GREEN}{Color.BOLD}Congratulations to our TEMPLE CHAMPIONS!{Color.END}")
-            print(f"{Color.CYAN}You're going to SPACE CAMP!{Color.END}\n")
+            buf.append(f"{Color.GREEN}{Color.BOLD}Congratulations to our TEMPLE CHAMPIONS!{Color.END}\n")
+            buf.append(f"{Color.CYAN}You're going to SPACE CAMP!{Color.END}\n\n")
         
         # Random sponsor message
         if self.prize_data and 'sponsor_announcements' in self.prize_data:
-            sponsor_msg = random.choice(self.prize_data['sponsor_announcements'])
-            print(f"{Color.PURPLE}{sponsor_msg}{Color.END}\n")
+            sponsor_msg = self._rng.choice(self.prize_data['sponsor_announcements'])
+            buf.append(f"{Color.PURPLE}{sponsor_msg}{Color.END}\n\n")
+        
+        sys.stdout.write(''.join(buf))
+        sys.stdout.flush()
 
 class TempleRunner:
     """Main game engine for the temple run"""
     
-    def __init__(self, temple_file: str):
+    # Image size passed to chafa (adjust to terminal width)
+    CHAFA_SIZE = '60x30'
+    
+    # Bits in _warn_flags for time warnings already given
+    WARNED_30 = 1
+    WARNED_60 = 2
+    
+    def __init__(self, temple_file: str, seed=None):
         """Load the temple configuration from JSON"""
-        with open(temple_file, 'r') as f:
-            self.temple_data = json.load(f)
+        # Own RNG so a seed replays the same guards, flavor text and sponsor
+        self._rng = random.Random(seed)
+        
+        # TEMPLE_FAST=1 skips the dramatic pauses (headless runs, benchmarking)
+        self.fast_mode = os.environ.get('TEMPLE_FAST') == '1'
+        
+        self.temple_data = load_json_cached(temple_file)
         
         self.rooms = self.temple_data['rooms']
+        self._room_render = self._build_room_render()
         self.current_room = 'entrance'
+        self._current_room_obj = self.rooms[self.current_room]  # refreshed in move_to_room
         self.player = Player()
         self.temple_guards_remaining = self.temple_data['temple_guards']
         self.guard_rooms = self._place_temple_guards()
         self.visited_rooms = set()
         self.start_time = None
+        self._warn_flags = 0
         
         # Initialize prize tracker
         prize_file = temple_file.replace('temple-map-graph.json', 'temple-prizes.json')
-        self.prize_tracker = PrizeTracker(prize_file)
+        self.prize_tracker = PrizeTracker(prize_file, self.fast_mode, self._rng)
         
         # Set up image directory path
         self.image_dir = Path('/home/aaron/Projects/games/maze/room_images')
+        self._chafa_cache: Dict[Tuple[str, str], bytes] = {}
+        self._chafa_key = None
+        self._chafa_proc = None
         self.enable_images = self.check_chafa_available()
         
-    def _place_temple_guards(self) -> List[str]:
+    def _build_room_render(self) -> Dict[str, List[Tuple[str, str, str, str]]]:
+        """Precompute (key, next_room, action_desc, target_name) rows for each room's actions"""
+        room_render = {}
+        for room_id, room in self.rooms.items():
+            actions = room.get('actions', [])
+            rows = []
+            for i, (key, next_room) in enumerate(room.get('connections', {}).items(), 1):
+                # Find matching action for this connection
+                action_desc = actions[min(i-1, len(actions)-1)] if i <= len(actions) else f"Go to {key}"
+                rows.append((key, next_room, action_desc, self.rooms[next_room]['name']))
+            room_render[room_id] = rows
+        return room_render
+    
+    def _place_temple_guards(self) -> Set[str]:
         """Randomly place temple guards in valid rooms"""
         guard_possible_rooms = [
             room_id for room_id, room in self.rooms.items()
             if room.get('temple_guard_possible', False)
         ]
-        return random.sample(guard_possible_rooms, 
-                           min(self.temple_guards_remaining, len(guard_possible_rooms)))
+        return set(self._rng.sample(guard_possible_rooms, 
+                                    min(self.temple_guards_remaining, len(guard_possible_rooms))))
     
     def check_chafa_available(self) -> bool:
         """Check if chafa is installed for image display"""
-        try:
-            result = subprocess.run(['which', 'chafa'], capture_output=True, text=True, stdin=subprocess.DEVNULL)
-            if result.returncode == 0:
-                print(f"{Color.GREEN}✓ Image support enabled (chafa found){Color.END}")
-                return True
-        except:
-            pass
+        # Keep the resolved path so each render skips the PATH search
+        self._chafa_path = shutil.which('chafa')
+        if self._chafa_path is not None:
+            print(f"{Color.GREEN}✓ Image support enabled (chafa found){Color.END}")
+            return True
         print(f"{Color.YELLOW}⚠ Image support disabled (install chafa for room images){Color.END}")
         return False
     
-    def display_room_image(self):
-        """Display the image for the current room using chafa"""
-        if not self.enable_images:
+    def start_room_image(self):
+        """Start rendering the current room's image with chafa in the background"""
+        self._chafa_key = None
+        self._chafa_proc = None
+        # Revisits get a one-line summary, so there's nothing to render
+        if not self.enable_images or self.current_room in self.visited_rooms:
             return
         
-        room = self.rooms[self.current_room]
+        room = self._current_room_obj
         image_filename = room.get('image_file')
         
         if not image_filename:
             return
         
+        # chafa output is deterministic per image and size, so reuse it
+        key = (image_filename, self.CHAFA_SIZE)
+        if key in self._chafa_cache:
+            self._chafa_key = key
+            return
+        
         image_path = self.image_dir / image_filename
         
         if image_path.exists():
             try:
-                # Use chafa to display the image
+                # Use chafa to render the image; output is piped so it can be
+                # written in order once the status screen is out
                 # --size: adjust to terminal width
-                # --symbols: use block characters for better quality
+                # --format/--symbols: use block characters for better quality
                 # --colors: use 256 colors
-                subprocess.run([
-                    'chafa',
-                    '--size', '60x30',  # Adjust size as needed
+                self._chafa_proc = subprocess.Popen([
+                    self._chafa_path,
+                    '--size', self.CHAFA_SIZE,
+                    '--format', 'symbols',
                     '--symbols', 'block',
                     '--colors', '256',
                     str(image_path)
-                ], check=False, stdin=subprocess.DEVNULL)
-                print()  # Add a blank line after the image
+                ], stdout=subprocess.PIPE, stdin=subprocess.DEVNULL)
+                self._chafa_key = key
             except Exception as e:
                 # Silently fail if image can't be displayed
                 pass
     
+    def display_room_image(self):
+        """Display the image rendered by start_room_image, if any"""
+        key, proc = self._chafa_key, self._chafa_proc
+        self._chafa_key = self._chafa_proc = None
+        if key is None:
+            return
+        
+        try:
+            output = self._chafa_cache.get(key)
+            if output is None:
+                output, _ = proc.communicate()
+                if proc.returncode == 0:
+                    self._chafa_cache[key] = output
+            # Write the raw bytes behind any buffered text
+            sys.stdout.flush()
+            sys.stdout.buffer.write(output)
+            sys.stdout.buffer.flush()
+            print()  # Add a blank line after the image
+        except Exception as e:
+            # Silently fail if image can't be displayed
+            pass
+    
     def olmec_speaks(self, message: str, color: str = Color.YELLOW):
         """Display Olmec's narration"""
         print(f"\n{color}{Color.BOLD}[OLMEC]: {message}{Color.END}")
-        time.sleep(0.5)
+        if not self.fast_mode:
+            time.sleep(0.5)
     
     def display_status(self):
         """Show current game status"""
@@ -230,27 +399,37 @@ class TempleRunner:
             elapsed = time.time() - self.start_time
             self.player.time_remaining = max(0, 180 - elapsed)
         
-        print(f"\n{Color.CYAN}{'='*60}")
         minutes = int(self.player.time_remaining // 60)
         seconds = int(self.player.time_remaining % 60)
-        print(f"⏱️  Time Remaining: {Color.BOLD}{minutes}:{seconds:02d}{Color.END}")
-        print(f"🏅 Pendants of Life: {Color.BOLD}{self.player.pendants_of_life}{Color.END}")
-        print(f"📍 Current Location: {Color.BOLD}{self.rooms[self.current_room]['name']}{Color.END}")
+        buf = [
+            f"\n{_SEP_CYAN}\n",
+            f"⏱️  Time Remaining: {Color.BOLD}{minutes}:{seconds:02d}{Color.END}\n",
+            f"🏅 Pendants of Life: {Color.BOLD}{self.player.pendants_of_life}{Color.END}\n",
+            f"📍 Current Location: {Color.BOLD}{self._current_room_obj['name']}{Color.END}\n",
+        ]
         if self.player.has_artifact:
-            print(f"👑 {Color.GREEN}{Color.BOLD}YOU HAVE THE JADE SERPENT'S CROWN!{Color.END}")
-        print(f"{Color.CYAN}{'='*60}{Color.END}\n")
+            buf.append(f"👑 {Color.GREEN}{Color.BOLD}YOU HAVE THE JADE SERPENT'S CROWN!{Color.END}\n")
+        buf.append(f"{_SEP_CYAN}{Color.END}\n\n")
+        sys.stdout.write(''.join(buf))
     
     def describe_room(self):
         """Describe the current room"""
-        room = self.rooms[self.current_room]
+        room = self._current_room_obj
+        
+        # Already been here - skip the image and full description
+        if self.current_room in self.visited_rooms:
+            sys.stdout.write(f"\n{Color.PURPLE}{Color.BOLD}You are back in: {room['name'].upper()}{Color.END}\n\n")
+            return
         
         # Display the room image if available
         self.display_room_image()
         
-        print(f"\n{Color.PURPLE}{Color.BOLD}{'~'*60}")
-        print(f"You are in: {room['name'].upper()}")
-        print(f"{'~'*60}{Color.END}\n")
-        print(f"{room['description']}\n")
+        sys.stdout.write(
+            f"\n{_TILDE_PURPLE}\n"
+            f"You are in: {room['name'].upper()}\n"
+            f"{_TILDE_END}\n\n"
+            f"{room['description']}\n\n"
+        )
         
     def check_temple_guard(self) -> bool:
         """Check if there's a temple guard in this room"""
@@ -261,7 +440,7 @@ class TempleRunner:
             
             if self.player.pendants_of_life > 0:
                 self.player.pendants_of_life -= 1
-                self.guard_rooms.remove(self.current_room)
+                self.guard_rooms.discard(self.current_room)
                 print(f"{Color.YELLOW}You give the guard a Pendant of Life and continue...{Color.END}")
                 return True
             else:
@@ -271,17 +450,12 @@ class TempleRunner:
     
     def show_available_actions(self) -> Dict[str, str]:
         """Display available actions and their corresponding connections"""
-        room = self.rooms[self.current_room]
-        actions = room.get('actions', [])
-        connections = room.get('connections', {})
+        connections = self._current_room_obj.get('connections', {})
         
         print(f"\n{Color.GREEN}Available actions:{Color.END}")
         action_map = {}
         
-        for i, (key, next_room) in enumerate(connections.items(), 1):
-            # Find matching action for this connection
-            action_desc = actions[min(i-1, len(actions)-1)] if i <= len(actions) else f"Go to {key}"
-            
+        for i, (key, next_room, action_desc, target_name) in enumerate(self._room_render[self.current_room], 1):
             # Show if this leads to a visited room
             visited_marker = " ✓" if next_room in self.visited_rooms else ""
             
@@ -289,7 +463,7 @@ class TempleRunner:
             if next_room == 'heart_chamber' and not self.player.has_artifact:
                 visited_marker = " 👑"
             
-            print(f"  {i}. {action_desc} → [{self.rooms[next_room]['name']}{visited_marker}]")
+            print(f"  {i}. {action_desc} → [{target_name}{visited_marker}]")
             action_map[str(i)] = next_room
             
         if 'back' in connections:
@@ -304,6 +478,7 @@ class TempleRunner:
         self.visited_rooms.add(self.current_room)
         self.player.path_taken.append(self.current_room)
         self.current_room = new_room
+        self._current_room_obj = self.rooms[new_room]
         
         # Check if we found the artifact!
         if self.current_room == 'heart_chamber' and not self.player.has_artifact:
@@ -311,7 +486,8 @@ class TempleRunner:
             print(f"\n{Color.GREEN}{Color.BOLD}🎉 The crown glimmers with ancient power! 🎉{Color.END}")
             print(f"{Color.YELLOW}Now race back to the temple entrance!{Color.END}")
             self.player.has_artifact = True
-            time.sleep(2)
+            if not self.fast_mode:
+                time.sleep(2)
     
     def update_time(self) -> bool:
         """Update remaining time and check if time's up"""
@@ -323,12 +499,12 @@ class TempleRunner:
                 return False
                 
             # Time warnings at specific thresholds (only warn once)
-            if self.player.time_remaining <= 30 and not hasattr(self, 'warned_30'):
+            if self.player.time_remaining <= 30 and not self._warn_flags & self.WARNED_30:
                 self.olmec_speaks("THIRTY SECONDS!", Color.RED)
-                self.warned_30 = True
-            elif self.player.time_remaining <= 60 and not hasattr(self, 'warned_60'):
+                self._warn_flags |= self.WARNED_30
+            elif self.player.time_remaining <= 60 and not self._warn_flags & self.WARNED_60:
                 self.olmec_speaks("ONE MINUTE REMAINING!", Color.YELLOW)  
-                self.warned_60 = True
+                self._warn_flags |= self.WARNED_60
                 
         return True
     
@@ -344,7 +520,8 @@ class TempleRunner:
                          f"and return to the temple gates...")
         self.olmec_speaks("Or you will be locked in my temple... FOREVER!", Color.RED)
         print(f"\n{Color.CYAN}The temple doors open with a grinding sound of ancient stone...{Color.END}")
-        time.sleep(2)
+        if not self.fast_mode:
+            time.sleep(2)
         
         self.start_time = time.time()
         
@@ -358,6 +535,9 @@ class TempleRunner:
                 self.show_final_stats(won=False)
                 break
             
+            # Let chafa render while the status screen goes out
+            self.start_room_image()
+            
             # Display current state
             self.display_status()
             self.describe_room()
@@ -393,19 +573,15 @@ class TempleRunner:
                 
                 # Dramatic pause for effect
                 print(f"\n{Color.CYAN}You make your choice...{Color.END}")
-                time.sleep(1)
+                if not self.fast_mode:
+                    time.sleep(1)
                 
                 # Random flavor text
-                if random.random() < 0.3:
-                    flavor = random.choice([
-                        "The ancient mechanisms groan as a door opens...",
-                        "Stone grinds against stone...",
-                        "You hear whispers from the temple spirits...",
-                        "The path ahead beckons...",
-                        "Your footsteps echo through the ancient halls..."
-                    ])
+                if self._rng.random() < 0.3:
+                    flavor = self._rng.choice(_FLAVOR_TEXTS)
                     print(f"{Color.PURPLE}{flavor}{Color.END}")
-                    time.sleep(1)
+                    if not self.fast_mode:
+                        time.sleep(1)
                 
                 self.move_to_room(next_room)
             else:
@@ -413,9 +589,9 @@ class TempleRunner:
     
     def show_final_stats(self, won: bool):
         """Display final game statistics"""
-        print(f"\n{Color.CYAN}{'='*60}")
+        print(f"\n{_SEP_CYAN}")
         print(f"{Color.BOLD}FINAL STATISTICS{Color.END}")
-        print(f"{'='*60}{Color.END}")
+        print(_SEP_END)
         
         if won:
             print(f"Result: {Color.GREEN}{Color.BOLD}VICTORY!{Color.END}")
@@ -447,7 +623,8 @@ def main():
     print(f"{Color.END}")
     
     try:
-        runner = TempleRunner('/home/aaron/Projects/games/maze/temple-map-graph.json')
+        runner = TempleRunner('/home/aaron/Projects/games/maze/temple-map-graph.json',
+                              seed=os.environ.get('TEMPLE_SEED'))
         runner.run_temple()
     except FileNotFoundError:
         print(f"{Color.RED}Error: Could not find temple-map-graph.json{Color.END}")